@@ -1,11 +1,34 @@
+import atexit
 import logging
+import threading
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster request/response handling"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 app.config["SECRET_KEY"] = "dev-assistant-secret-key"
 
 from app.services import EnhancedServiceChecker
@@ -13,5 +36,22 @@ from config import DevAssistantConfig
 
 checker = EnhancedServiceChecker()
 config = DevAssistantConfig()
+atexit.register(checker.close)
+
+
+def start_monitoring():
+    """Start background checks of all configured services if enabled"""
+    monitoring = config.config.get("monitoring", {})
+    if not monitoring.get("enabled", False):
+        return None
+
+    thread = threading.Thread(
+        target=checker.run_monitor,
+        args=(config.get_all_services(), monitoring.get("check_interval", 60)),
+        name="service-monitor",
+        daemon=True,
+    )
+    thread.start()
+    return thread
 
 from app import routes
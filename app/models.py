@@ -3,7 +3,7 @@ from typing import Optional
 import time
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceResult:
     """Data class for service check results"""
 
@@ -11,7 +11,7 @@ class ServiceResult:
     status: str
     response_time: Optional[float] = None
     error_message: Optional[str] = None
-    details: Optional[str] = None  # Add this field
+    details: Optional[str] = None
     timestamp: Optional[float] = None
 
     def __post_init__(self):
@@ -1,6 +1,10 @@
-from flask import jsonify, render_template, request
+import logging
+
+from flask import Response, jsonify, render_template, request, stream_with_context
 from app import app, checker, config
 
+logger = logging.getLogger(__name__)
+
 
 @app.route("/")
 def dashboard():
@@ -23,10 +27,9 @@ def check_service(service_type):
             if not port:
                 return jsonify({"error": "Port is required"}), 400
 
-            try:
-                port = int(port)
-            except (TypeError, ValueError):
-                return jsonify({"error": "Port must be a number"}), 400
+            port, error = _parse_port(port)
+            if error:
+                return jsonify({"error": error}), 400
 
             result = checker.check_port_service(host, port)
             return jsonify(result.to_dict())
@@ -40,18 +43,103 @@ def check_service(service_type):
             return jsonify(result.to_dict())
 
         elif service_type == "batch":
-            services = data.get("services", [])
-            if not services:
-                return jsonify({"error": "Services list is required"}), 400
-
-            result = checker.check_multiple_services(services)
-            return jsonify(result)
+            return _batch_check(data, stream=bool(data.get("stream")))
 
         else:
             return jsonify({"error": f"Invalid service type: {service_type}"}), 400
 
     except Exception as e:
-        print(f"Error in check_service: {str(e)}")
+        logger.exception("Error in check_service")
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+
+def _batch_check(data, stream=False):
+    """Validate a batch request, then return its results or stream them"""
+    services = data.get("services", [])
+    if not services:
+        return jsonify({"error": "Services list is required"}), 400
+
+    error = _validate_services(services)
+    if error:
+        return jsonify({"error": error}), 400
+
+    fail_fast = bool(data.get("fail_fast", False))
+    if stream:
+        return Response(
+            stream_with_context(_stream_results(services, fail_fast)),
+            mimetype="application/x-ndjson",
+        )
+
+    result = checker.check_multiple_services(services, fail_fast=fail_fast)
+    return jsonify(result)
+
+
+def _parse_port(value):
+    """Return (port, error) for a port given as an integer or numeric string"""
+    if isinstance(value, bool) or (
+        isinstance(value, float) and not value.is_integer()
+    ):
+        return None, "Port must be a number"
+    try:
+        port = int(value)
+    except (TypeError, ValueError):
+        return None, "Port must be a number"
+    if not 1 <= port <= 65535:
+        return None, "Port must be between 1 and 65535"
+    return port, None
+
+
+def _validate_services(services):
+    """Return an error message for the first malformed service entry, if any.
+
+    Port values are coerced to int in place with the single-port route's rule.
+    """
+    if not isinstance(services, list):
+        return "Services must be a list"
+
+    for index, service in enumerate(services):
+        if not isinstance(service, dict):
+            return f"Service {index} must be an object"
+
+        service_type = service.get("type")
+        if service_type == "http":
+            if not isinstance(service.get("url"), str) or not service["url"]:
+                return f"Service {index}: URL is required"
+        elif service_type == "port":
+            port, error = _parse_port(service.get("port"))
+            if error:
+                return f"Service {index}: {error}"
+            service["port"] = port
+            host = service.get("host", "localhost")
+            if not isinstance(host, str):
+                return f"Service {index}: Host must be a string"
+
+    return None
+
+
+def _stream_results(services, fail_fast=False):
+    """Yield one JSON line per service result, then a summary line"""
+    results = []
+    for result in checker.iter_multiple_services(services, fail_fast=fail_fast):
+        results.append(result)
+        yield app.json.dumps(result.to_dict()) + "\n"
+
+    summary = checker.summarize_results(results, include_services=False)
+    yield app.json.dumps({"summary": summary}) + "\n"
+
+
+@app.route("/api/check/batch/stream", methods=["POST"])
+def stream_batch_check():
+    """Stream batch check results as NDJSON while checks complete"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        return _batch_check(data, stream=True)
+
+    except Exception as e:
+        logger.exception("Error in stream_batch_check")
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 
@@ -99,24 +187,19 @@ def stop_service(service_type):
             return jsonify({"error": f"Invalid stop service type: {service_type}"}), 400
 
     except Exception as e:
-        print(f"Error in stop_service: {str(e)}")
+        logger.exception("Error in stop_service")
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 
-# ... rest of existing routes remain the same ...
-
-
 @app.route("/api/services/<category>")
 def get_category_services(category):
     """Get services for a specific category"""
     try:
-        if category == "all":
-            services = config.get_services()
-        else:
-            services = config.get_services(category)
-        return jsonify(services)
+        # The services config only changes on save, so serve the cached JSON
+        services_json = config.get_services_json(None if category == "all" else category)
+        return app.response_class(f"{services_json}\n", mimetype="application/json")
     except Exception as e:
-        print(f"Error in get_category_services: {str(e)}")
+        logger.exception("Error in get_category_services")
         return jsonify({"error": str(e)}), 500
 
 
@@ -135,7 +218,7 @@ def get_service_history(service_name):
             }
         )
     except Exception as e:
-        print(f"Error in get_service_history: {str(e)}")
+        logger.exception("Error in get_service_history")
         return jsonify({"error": str(e)}), 500
 
 
@@ -154,7 +237,7 @@ def handle_config():
             config.save_config()
             return jsonify({"message": "Configuration updated successfully"})
     except Exception as e:
-        print(f"Error in handle_config: {str(e)}")
+        logger.exception("Error in handle_config")
         return jsonify({"error": str(e)}), 500
 
 
@@ -162,29 +245,25 @@ def handle_config():
 def monitoring_status():
     """Monitoring status page"""
     try:
-        all_services = config.get_services()
+        all_services = config.get_all_services()
         service_stats = {}
-        total_services = 0
-
-        for category, services in all_services.items():
-            if services:
-                total_services += len(services)
-                for service in services:
-                    service_name = f"{service['name']} ({service['type']})"
-                    uptime = checker.history.get_uptime_percentage(service_name)
-                    recent_history = checker.history.get_history(service_name, 10)
-
-                    service_stats[service_name] = {
-                        "uptime": uptime,
-                        "recent_checks": len(recent_history),
-                        "last_status": (
-                            recent_history[-1].status if recent_history else "unknown"
-                        ),
-                    }
+
+        for service in all_services:
+            service_name = f"{service['name']} ({service['type']})"
+            uptime = checker.history.get_uptime_percentage(service_name)
+            recent_history = checker.history.get_history(service_name, 10)
+
+            service_stats[service_name] = {
+                "uptime": uptime,
+                "recent_checks": len(recent_history),
+                "last_status": (
+                    recent_history[-1].status if recent_history else "unknown"
+                ),
+            }
 
         return jsonify(
             {
-                "total_services": total_services,
+                "total_services": len(all_services),
                 "service_stats": service_stats,
                 "monitoring_enabled": config.config.get("monitoring", {}).get(
                     "enabled", False
@@ -192,7 +271,7 @@ def monitoring_status():
             }
         )
     except Exception as e:
-        print(f"Error in monitoring_status: {str(e)}")
+        logger.exception("Error in monitoring_status")
         return jsonify({"error": str(e)}), 500
 
 
@@ -1,64 +1,312 @@
+import errno
+import logging
+import math
+import queue
+import selectors
+import shutil
 import socket
 import time
 import threading
 import subprocess
+import sys
 import psutil
-import signal
-import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import ParseResult, urlparse
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 import requests
+from requests.adapters import HTTPAdapter
 from app.models import ServiceResult
 
+logger = logging.getLogger(__name__)
+
 # Constants
 DEFAULT_TIMEOUT = 5.0
-MAX_WORKERS = 10
+# Local refusals are immediate except on Windows, which retries a refused
+# connect for about 2s; a short deadline there would report "timeout"
+LOCAL_PORT_TIMEOUT = DEFAULT_TIMEOUT if sys.platform == "win32" else 0.1
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+MAX_WORKERS = 64  # checks mostly wait on sockets, so threads are cheap
 HISTORY_RETENTION_HOURS = 24
+HISTORY_RETENTION_SECONDS = HISTORY_RETENTION_HOURS * 3600
+HISTORY_MAX_ENTRIES = 4096
+UPTIME_WINDOW = 100  # most recent checks counted towards uptime
+MONITOR_BACKOFF_FACTOR = 1.5
+MAX_MONITOR_INTERVAL = 300  # seconds
+HEALTHY_STATUSES = frozenset({"up", "open"})
+RESULT_CACHE_TTL = 1.5  # seconds
+RESULT_CACHE_MAX_ENTRIES = 512
+PROCESS_SNAPSHOT_TTL = 0.5  # seconds
+HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+PROBE_DRAIN_MAX_BYTES = 64 * 1024  # larger bodies cost more than a reconnect
+RESOLVE_CACHE_TTL = 60  # seconds; container and VM addresses do change
+RESOLVE_CACHE_MAX_ENTRIES = 256
+
+COMMON_PORTS = {
+    21: "FTP - File Transfer Protocol",
+    22: "SSH - Secure Shell",
+    23: "Telnet",
+    25: "SMTP - Simple Mail Transfer Protocol",
+    53: "DNS - Domain Name System",
+    80: "HTTP - HyperText Transfer Protocol",
+    110: "POP3 - Post Office Protocol v3",
+    143: "IMAP - Internet Message Access Protocol",
+    443: "HTTPS - HTTP Secure",
+    993: "IMAPS - IMAP over SSL",
+    995: "POP3S - POP3 over SSL",
+    3000: "Node.js Development Server",
+    3001: "React Development Server (Alt)",
+    4200: "Angular Development Server",
+    5000: "Flask Development Server",
+    5432: "PostgreSQL Database",
+    6379: "Redis Database",
+    8000: "Django Development Server / HTTP Alt",
+    8080: "HTTP Alternative / Tomcat",
+    9000: "PHP-FPM / SonarQube",
+    27017: "MongoDB Database",
+    3306: "MySQL/MariaDB Database",
+}
+
+# Descriptions for the well-known ports, formatted once at import
+PORT_DESCRIPTIONS = {
+    port: f"Port {port} - {name}" for port, name in COMMON_PORTS.items()
+}
+
+PORT_RANGE_TABLE = (
+    (3000, 3999, "Likely Development Server"),
+    (8000, 8999, "Likely Web Server/API"),
+)
+
+# connect_ex() codes meaning a non-blocking connect is still in progress
+_CONNECT_PENDING = frozenset(
+    code
+    for code in (
+        errno.EINPROGRESS,
+        errno.EWOULDBLOCK,
+        errno.EALREADY,
+        getattr(errno, "WSAEWOULDBLOCK", None),
+    )
+    if code is not None
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    """Parse a URL once; the dashboard polls the same URLs repeatedly"""
+    return urlparse(url)
+
+
+_resolve_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple[int, tuple]]]] = {}
+
+
+def _resolve_all(host: str, port: int) -> List[Tuple[int, tuple]]:
+    """Resolve host/port to every (family, sockaddr) and reuse them for a while"""
+    now = time.monotonic()
+    entry = _resolve_cache.get((host, port))
+    if entry is not None and now - entry[0] < RESOLVE_CACHE_TTL:
+        return entry[1]
+
+    addresses = [
+        (family, sockaddr)
+        for family, _, _, _, sockaddr in socket.getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+    ]
+
+    if len(_resolve_cache) >= RESOLVE_CACHE_MAX_ENTRIES:
+        _resolve_cache.clear()
+    _resolve_cache[(host, port)] = (now, addresses)
+    return addresses
+
+
+def _resolve(host: str, port: int) -> Tuple[int, tuple]:
+    """Resolve host/port to a single address family and sockaddr"""
+    addresses = _resolve_all(host, port)
+    # Prefer IPv4 so "localhost" keeps matching services bound to 127.0.0.1
+    return next((a for a in addresses if a[0] == socket.AF_INET), addresses[0])
+
+
+def _probe_ports(
+    targets: List[Tuple[str, int]], timeouts: List[float]
+) -> List[Tuple[Any, float]]:
+    """Run non-blocking TCP connects for all targets on one selector.
+
+    Returns an (outcome, elapsed seconds) pair per target, where outcome is
+    the connect errno (0 if open) or the exception that ended the probe.
+    """
+    outcomes: List[Optional[Tuple[Any, float]]] = [None] * len(targets)
+    deadlines: Dict[int, float] = {}
+    start = time.monotonic()
+    selector = selectors.DefaultSelector()
+
+    try:
+        for index, (host, port) in enumerate(targets):
+            sock = None
+            try:
+                # getaddrinfo wraps out-of-range ports modulo 65536
+                if not 0 <= port <= 65535:
+                    raise ValueError(f"Port {port} is out of range (0-65535)")
+                family, sockaddr = _resolve(host, port)
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                result = sock.connect_ex(sockaddr)
+                if result in _CONNECT_PENDING:
+                    selector.register(sock, selectors.EVENT_WRITE, index)
+                    deadlines[index] = start + timeouts[index]
+                    continue
+            except (OSError, ValueError) as e:
+                # e.g. resolution failure, or more sockets than select() takes
+                result = e
+
+            # The probe finished immediately; a TCP socket cannot be
+            # reconnected, so close it rather than keeping it for reuse
+            if sock is not None:
+                sock.close()
+            outcomes[index] = (result, time.monotonic() - start)
+
+        while selector.get_map():
+            waiting = list(selector.get_map().values())
+            remaining = min(deadlines[key.data] for key in waiting) - time.monotonic()
+            for key, _ in selector.select(max(0.0, remaining)):
+                selector.unregister(key.fileobj)
+                result = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                key.fileobj.close()
+                outcomes[key.data] = (result, time.monotonic() - start)
+
+            now = time.monotonic()
+            for key in list(selector.get_map().values()):
+                if deadlines[key.data] <= now:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    outcomes[key.data] = (socket.timeout(), now - start)
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+    return outcomes
+
+
+def _http_port_refused(parsed: ParseResult) -> bool:
+    """Whether a local HTTP target's TCP port actively refuses connections.
+
+    Only local hosts are probed: a refusal there is immediate and reliable,
+    while remote targets may sit behind proxies the probe would bypass.
+    Every address the host resolves to must refuse, since requests falls
+    back across them (e.g. a dev server bound only to ::1 for "localhost").
+    """
+    host = parsed.hostname
+    if host not in LOCAL_HOSTS:
+        return False
+
+    try:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        addresses = _resolve_all(host, port)
+    except (OSError, ValueError):
+        return False
+
+    targets = list(dict.fromkeys((sockaddr[0], port) for _, sockaddr in addresses))
+    outcomes = _probe_ports(targets, [LOCAL_PORT_TIMEOUT] * len(targets))
+    return all(outcome == errno.ECONNREFUSED for outcome, _ in outcomes)
+
+
+class _ProcSnapshot:
+    """Point-in-time view of running processes shared by the lookup helpers"""
+
+    def __init__(self):
+        self.timestamp = time.monotonic()
+        self.by_port: Dict[int, int] = {}
+        self.by_pid: Dict[int, psutil.Process] = {}
+        self.processes: List[Tuple[psutil.Process, str, str]] = []
+
+        scan_per_process = False
+        try:
+            # One walk of the kernel connection table instead of asking every
+            # process for its connections
+            for conn in psutil.net_connections(kind="inet"):
+                if conn.laddr and conn.pid:
+                    self.by_port.setdefault(conn.laddr.port, conn.pid)
+        except psutil.AccessDenied:
+            # macOS only exposes the system-wide table to root; fall back to
+            # asking each process, which still covers the user's own
+            scan_per_process = True
+        except Exception as e:
+            logger.error("Error reading network connections: %s", e)
+
+        try:
+            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+                info = proc.info
+                self.by_pid[proc.pid] = proc
+                if scan_per_process:
+                    self._add_process_ports(proc)
+                self.processes.append(
+                    (
+                        proc,
+                        (info["name"] or "").lower(),
+                        " ".join(info["cmdline"] or ()).lower(),
+                    )
+                )
+        except Exception as e:
+            logger.error("Error listing processes: %s", e)
+
+    def _add_process_ports(self, proc: psutil.Process):
+        # psutil 6 renamed Process.connections() to net_connections()
+        get_connections = getattr(proc, "net_connections", None) or proc.connections
+        try:
+            for conn in get_connections(kind="inet"):
+                if conn.laddr:
+                    self.by_port.setdefault(conn.laddr.port, proc.pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self.timestamp > PROCESS_SNAPSHOT_TTL
 
 
 class ServiceManager:
     """Manages starting and stopping services"""
 
-    def __init__(self):
+    _docker_available: Optional[bool] = None
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
         self.managed_processes = {}  # Store process references
+        self.executor = executor or ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self._snapshot: Optional[_ProcSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+
+    def _get_snapshot(self) -> _ProcSnapshot:
+        """Return the cached process snapshot, rebuilding it once stale"""
+        with self._snapshot_lock:
+            if self._snapshot is None or self._snapshot.is_stale():
+                self._snapshot = _ProcSnapshot()
+            return self._snapshot
+
+    def _invalidate_snapshot(self):
+        with self._snapshot_lock:
+            self._snapshot = None
 
     def find_process_by_port(self, port: int) -> Optional[psutil.Process]:
         """Find process using a specific port"""
+        snapshot = self._get_snapshot()
+        pid = snapshot.by_port.get(port)
+        if pid is None:
+            return None
         try:
-            for proc in psutil.process_iter(["pid", "name", "connections"]):
-                try:
-                    connections = proc.info["connections"]
-                    if connections:
-                        for conn in connections:
-                            if conn.laddr.port == port:
-                                return psutil.Process(proc.info["pid"])
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except Exception as e:
-            print(f"Error finding process on port {port}: {e}")
-        return None
+            # Reuse the Process that process_iter already built when we can
+            return snapshot.by_pid.get(pid) or psutil.Process(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
 
     def find_processes_by_name(self, name: str) -> List[psutil.Process]:
         """Find processes by name pattern"""
         processes = []
-        try:
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                try:
-                    proc_info = proc.info
-                    if name.lower() in proc_info["name"].lower() or any(
-                        name.lower() in arg.lower()
-                        for arg in (proc_info["cmdline"] or [])
-                    ):
-                        processes.append(psutil.Process(proc_info["pid"]))
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except Exception as e:
-            print(f"Error finding processes by name {name}: {e}")
+        name_lower = name.lower()
+        for proc, proc_name, cmdline in self._get_snapshot().processes:
+            if name_lower in proc_name or name_lower in cmdline:
+                processes.append(proc)
         return processes
 
     def stop_service_by_port(self, port: int) -> Dict[str, Any]:
@@ -79,6 +327,7 @@ class ServiceManager:
 
             # Try graceful shutdown first
             process.terminate()
+            self._invalidate_snapshot()
 
             # Wait for process to terminate
             try:
@@ -113,6 +362,22 @@ class ServiceManager:
                 "message": f"Error stopping service on port {port}: {str(e)}",
             }
 
+    def _terminate_one(self, process: psutil.Process) -> Dict[str, Any]:
+        """Terminate a process, force killing it if it does not exit in time"""
+        process_info = {
+            "pid": process.pid,
+            "name": process.name(),
+            "cmdline": " ".join(process.cmdline()),
+        }
+
+        process.terminate()
+        try:
+            process.wait(timeout=3)
+            return process_info
+        except psutil.TimeoutExpired:
+            process.kill()
+            return {**process_info, "force_killed": True}
+
     def stop_service_by_name(self, service_name: str) -> Dict[str, Any]:
         """Stop service by name/pattern"""
         try:
@@ -126,24 +391,18 @@ class ServiceManager:
             stopped_processes = []
             errors = []
 
-            for process in processes:
+            # Terminate matches in parallel so N slow exits cost one wait
+            futures = {
+                self.executor.submit(self._terminate_one, process): process
+                for process in processes
+            }
+            for future in as_completed(futures):
                 try:
-                    process_info = {
-                        "pid": process.pid,
-                        "name": process.name(),
-                        "cmdline": " ".join(process.cmdline()),
-                    }
-
-                    process.terminate()
-                    try:
-                        process.wait(timeout=3)
-                        stopped_processes.append(process_info)
-                    except psutil.TimeoutExpired:
-                        process.kill()
-                        stopped_processes.append({**process_info, "force_killed": True})
-
+                    stopped_processes.append(future.result())
                 except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                    errors.append(f"PID {process.pid}: {str(e)}")
+                    errors.append(f"PID {futures[future].pid}: {str(e)}")
+
+            self._invalidate_snapshot()
 
             if stopped_processes:
                 return {
@@ -165,14 +424,22 @@ class ServiceManager:
                 "message": f'Error stopping service "{service_name}": {str(e)}',
             }
 
+    def _is_docker_available(self) -> bool:
+        """Check for a working docker CLI once and remember the answer"""
+        if ServiceManager._docker_available is None:
+            available = shutil.which("docker") is not None
+            if available:
+                result = subprocess.run(
+                    ["docker", "--version"], capture_output=True, text=True, timeout=5
+                )
+                available = result.returncode == 0
+            ServiceManager._docker_available = available
+        return ServiceManager._docker_available
+
     def stop_docker_container(self, container_name: str) -> Dict[str, Any]:
         """Stop Docker container"""
         try:
-            # Check if Docker is available
-            result = subprocess.run(
-                ["docker", "--version"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode != 0:
+            if not self._is_docker_available():
                 return {
                     "success": False,
                     "message": "Docker is not available on this system",
@@ -213,37 +480,91 @@ class ServiceManager:
 
 class ServiceHistory:
     def __init__(self):
-        self.history: Dict[str, List[ServiceResult]] = defaultdict(list)
+        self.history: Dict[str, Deque[ServiceResult]] = defaultdict(
+            lambda: deque(maxlen=HISTORY_MAX_ENTRIES)
+        )
         self.lock = threading.Lock()
+        self._snapshots: Dict[str, Tuple[int, Tuple[ServiceResult, ...]]] = {}
+        self._uptime: Dict[str, Tuple[int, int]] = {}
+        self._pending: "queue.SimpleQueue[ServiceResult]" = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._drain_pending, name="service-history-writer", daemon=True
+        )
+        self._writer.start()
 
     def add_result(self, result: ServiceResult):
-        with self.lock:
-            service_name = result.name
-            self.history[service_name].append(result)
+        """Queue a result; the writer thread records it off the check path"""
+        self._pending.put(result)
 
-            # Clean old entries
-            cutoff_time = datetime.now() - timedelta(hours=HISTORY_RETENTION_HOURS)
-            self.history[service_name] = [
-                r
-                for r in self.history[service_name]
-                if r.timestamp and datetime.fromtimestamp(r.timestamp) > cutoff_time
-            ]
+    def _drain_pending(self):
+        while True:
+            result = self._pending.get()
+            try:
+                self._apply(result)
+            except Exception:
+                # Keep the writer alive; a dead thread would freeze history
+                logger.exception("Error recording history for %s", result.name)
 
-    def get_history(self, service_name: str, limit: int = 50) -> List[ServiceResult]:
+    def _apply(self, result: ServiceResult):
         with self.lock:
-            return self.history.get(service_name, [])[-limit:]
+            results = self.history[result.name]
+            successes, total = self._uptime.get(result.name, (0, 0))
+
+            # The deque's maxlen is far above UPTIME_WINDOW, so an entry it
+            # evicts on append is never inside the uptime window
+            results.append(result)
+            successes += result.status in HEALTHY_STATUSES
+            total += 1
+            if len(results) > UPTIME_WINDOW:
+                leaving = results[-UPTIME_WINDOW - 1]
+                successes -= leaving.status in HEALTHY_STATUSES
+                total -= 1
+
+            # Clean old entries; timestamps are epoch floats, compare directly
+            cutoff = time.time() - HISTORY_RETENTION_SECONDS
+            while results and (
+                not results[0].timestamp or results[0].timestamp <= cutoff
+            ):
+                evicted = results.popleft()
+                if len(results) < UPTIME_WINDOW:
+                    successes -= evicted.status in HEALTHY_STATUSES
+                    total -= 1
+
+            self._uptime[result.name] = (successes, total)
+            self._snapshots.pop(result.name, None)
+
+    def _snapshot(self, service_name: str, limit: int) -> Tuple[ServiceResult, ...]:
+        """Return an immutable copy of a service's latest results for lock-free reads"""
+        entry = self._snapshots.get(service_name)
+        if entry is None or entry[0] < limit:
+            # Rebuilt at most once per write (or wider limit), only on read
+            with self.lock:
+                results = self.history.get(service_name)
+                if not results:
+                    # Don't cache unknown names; they come straight from the URL
+                    return ()
+                entry = self._snapshots.get(service_name)
+                if entry is None or entry[0] < limit:
+                    # Copy just the tail rather than the whole deque
+                    tail = list(islice(reversed(results), limit))
+                    tail.reverse()
+                    entry = (limit, tuple(tail))
+                    self._snapshots[service_name] = entry
+        return entry[1]
 
-    def get_uptime_percentage(self, service_name: str, hours: int = 24) -> float:
-        with self.lock:
-            recent_results = self.get_history(service_name, 100)
-            if not recent_results:
-                return 0.0
+    def get_history(self, service_name: str, limit: int = 50) -> List[ServiceResult]:
+        if limit <= 0:
+            limit = HISTORY_MAX_ENTRIES
+        return list(self._snapshot(service_name, limit)[-limit:])
 
-            successful_checks = len(
-                [r for r in recent_results if r.status in ["up", "open"]]
-            )
+    def get_uptime_percentage(self, service_name: str, hours: int = 24) -> float:
+        # Counters for the last UPTIME_WINDOW checks are kept up to date by
+        # the writer and swapped in as one tuple, so this is a plain read
+        successful_checks, total_checks = self._uptime.get(service_name, (0, 0))
+        if not total_checks:
+            return 0.0
 
-            return (successful_checks / len(recent_results)) * 100
+        return (successful_checks / total_checks) * 100
 
 
 class EnhancedServiceChecker:
@@ -252,79 +573,124 @@ class EnhancedServiceChecker:
     def __init__(self):
         self.history = ServiceHistory()
         self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
-        self.manager = ServiceManager()
+        self.manager = ServiceManager(self.executor)
+        self.session = self._create_session()
+        self.cache_ttl = RESULT_CACHE_TTL
+        self._cache: Dict[tuple, Tuple[float, ServiceResult]] = {}
+        self._cache_lock = threading.Lock()
+
+    def close(self):
+        """Release pooled connections and stop the worker threads"""
+        self.session.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_cached(self, key: tuple) -> Optional[ServiceResult]:
+        """Return a result checked within the cache TTL, if any"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        return None
+
+    def _store_cached(self, key: tuple, result: ServiceResult):
+        """Remember a fresh result so duplicate checks can reuse it"""
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._cache) >= RESULT_CACHE_MAX_ENTRIES:
+                self._cache = {
+                    k: v for k, v in self._cache.items() if now - v[0] < self.cache_ttl
+                }
+            self._cache[key] = (now, result)
+
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session so repeated checks reuse connections"""
+        session = requests.Session()
+        # No more than MAX_WORKERS checks can hold a connection at once
+        adapter = HTTPAdapter(
+            pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=0
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = "DevEnvironmentAssistant/1.0"
+        return session
 
     def get_port_description(self, port: int) -> str:
         """Get detailed description for a port including common services"""
-        common_ports = {
-            21: "FTP - File Transfer Protocol",
-            22: "SSH - Secure Shell",
-            23: "Telnet",
-            25: "SMTP - Simple Mail Transfer Protocol",
-            53: "DNS - Domain Name System",
-            80: "HTTP - HyperText Transfer Protocol",
-            110: "POP3 - Post Office Protocol v3",
-            143: "IMAP - Internet Message Access Protocol",
-            443: "HTTPS - HTTP Secure",
-            993: "IMAPS - IMAP over SSL",
-            995: "POP3S - POP3 over SSL",
-            3000: "Node.js Development Server",
-            3001: "React Development Server (Alt)",
-            4200: "Angular Development Server",
-            5000: "Flask Development Server",
-            5432: "PostgreSQL Database",
-            6379: "Redis Database",
-            8000: "Django Development Server / HTTP Alt",
-            8080: "HTTP Alternative / Tomcat",
-            9000: "PHP-FPM / SonarQube",
-            27017: "MongoDB Database",
-            3306: "MySQL/MariaDB Database",
-        }
+        description = PORT_DESCRIPTIONS.get(port)
+        if description is not None:
+            return description
 
-        if port in common_ports:
-            return f"Port {port} - {common_ports[port]}"
-        elif 3000 <= port <= 3999:
-            return f"Port {port} - Likely Development Server"
-        elif 8000 <= port <= 8999:
-            return f"Port {port} - Likely Web Server/API"
-        else:
-            return f"Port {port} - Custom Service"
+        for low, high, label in PORT_RANGE_TABLE:
+            if low <= port <= high:
+                return f"Port {port} - {label}"
+        return f"Port {port} - Custom Service"
 
     def check_port_service(
-        self, host: str, port: int, timeout: float = DEFAULT_TIMEOUT
+        self, host: str, port: int, timeout: Optional[float] = None
     ) -> ServiceResult:
-        start_time = time.time()
-        description = self.get_port_description(port)
-
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-
-            response_time = (time.time() - start_time) * 1000
-
-            if result == 0:
-                status = "open"
-                details = f"{description} is accessible"
-                error_message = None
+        return self.check_ports_batch([(host, port)], timeout)[0]
+
+    def check_ports_batch(
+        self, targets: List[Tuple[str, int]], timeout: Optional[float] = None
+    ) -> List[ServiceResult]:
+        """Check many host/port pairs at once with a single selector"""
+        results: List[Optional[ServiceResult]] = [None] * len(targets)
+        pending = []
+        for index, (host, port) in enumerate(targets):
+            cached = self._get_cached(("port", host, port))
+            if cached is not None:
+                results[index] = cached
             else:
-                status = "closed"
-                details = f"{description} is not accessible"
-                error_message = f"Connection refused to {host}:{port}"
+                pending.append(index)
+
+        if not pending:
+            return results
+
+        timeouts = [
+            timeout
+            if timeout is not None
+            else LOCAL_PORT_TIMEOUT if targets[index][0] in LOCAL_HOSTS
+            else DEFAULT_TIMEOUT
+            for index in pending
+        ]
+        outcomes = _probe_ports([targets[index] for index in pending], timeouts)
+
+        for index, probe_timeout, (outcome, elapsed) in zip(
+            pending, timeouts, outcomes
+        ):
+            host, port = targets[index]
+            result = self._build_port_result(host, port, outcome, elapsed, probe_timeout)
+            self.history.add_result(result)
+            self._store_cached(("port", host, port), result)
+            results[index] = result
+
+        return results
+
+    def _build_port_result(
+        self, host: str, port: int, outcome: Any, elapsed: float, timeout: float
+    ) -> ServiceResult:
+        description = self.get_port_description(port)
+        response_time = elapsed * 1000
 
-        except socket.timeout:
+        if isinstance(outcome, socket.timeout):
             response_time = timeout * 1000
             status = "timeout"
             details = f"{description} - Connection timeout"
             error_message = f"Timeout connecting to {host}:{port} after {timeout}s"
-        except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+        elif isinstance(outcome, Exception):
             status = "error"
             details = f"{description} - Connection error"
-            error_message = str(e)
+            error_message = str(outcome)
+        elif outcome == 0:
+            status = "open"
+            details = f"{description} is accessible"
+            error_message = None
+        else:
+            status = "closed"
+            details = f"{description} is not accessible"
+            error_message = f"Connection refused to {host}:{port}"
 
-        result = ServiceResult(
+        return ServiceResult(
             name=f"Port {port} Service Check",
             status=status,
             response_time=response_time,
@@ -333,9 +699,6 @@ class EnhancedServiceChecker:
             timestamp=time.time(),
         )
 
-        self.history.add_result(result)
-        return result
-
     def check_http_service(
         self,
         url: str,
@@ -343,11 +706,22 @@ class EnhancedServiceChecker:
         expected_status: Optional[int] = None,
         method: str = "GET",
     ) -> ServiceResult:
+        cache_key = ("http", url, method, expected_status)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         start_time = time.time()
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
 
         try:
-            response = requests.request(method, url, timeout=timeout)
+            # Skip the full HTTP request when nothing is listening locally.
+            # A service that was up last time most likely still is, and has
+            # a pooled connection waiting, so don't spend a connect on it.
+            if not self._was_up(url) and _http_port_refused(parsed):
+                raise requests.exceptions.ConnectionError(url)
+
+            response = self._send_probe(url, method, timeout, expected_status)
             response_time = (time.time() - start_time) * 1000
 
             expected = expected_status or 200
@@ -391,9 +765,43 @@ class EnhancedServiceChecker:
         )
 
         self.history.add_result(result)
+        self._store_cached(cache_key, result)
         return result
 
-    def _get_http_description(self, parsed: urlparse, response) -> str:
+    def _was_up(self, url: str) -> bool:
+        last = self.history.get_history(f"HTTP Service: {url}", 1)
+        return bool(last) and last[-1].status in HEALTHY_STATUSES
+
+    def _send_probe(
+        self,
+        url: str,
+        method: str,
+        timeout: float,
+        expected_status: Optional[int],
+    ) -> requests.Response:
+        """Send the health-check request without downloading the body"""
+        if method == "GET" and expected_status is None:
+            # A HEAD answers liveness with headers only; fall back to GET for
+            # servers that don't implement it
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+            if response.status_code not in HEAD_UNSUPPORTED_STATUSES:
+                return response
+
+        # Only the status line and headers matter, but urllib3 discards a
+        # connection with unread data, so drain small bodies to keep it pooled
+        response = self.session.request(method, url, timeout=timeout, stream=True)
+        drained = 0
+        try:
+            for chunk in response.iter_content(8192):
+                drained += len(chunk)
+                if drained > PROBE_DRAIN_MAX_BYTES:
+                    break
+        except requests.exceptions.RequestException:
+            pass
+        response.close()
+        return response
+
+    def _get_http_description(self, parsed: ParseResult, response) -> str:
         try:
             server = response.headers.get("Server", "Unknown")
             content_type = response.headers.get("Content-Type", "Unknown")
@@ -401,26 +809,144 @@ class EnhancedServiceChecker:
         except:
             return f"HTTP service at {parsed.netloc} is responding"
 
-    def check_multiple_services(self, services: List[Dict[str, Any]]) -> Dict[str, Any]:
-        results = []
+    @staticmethod
+    def _response_time_stats(response_times: List[float]) -> Dict[str, Any]:
+        """Summarize batch response times (ms) with one sort"""
+        if not response_times:
+            return {"avg": None, "p50": None, "p95": None, "max": None}
 
-        for service in services:
+        ordered = sorted(response_times)
+        count = len(ordered)
+        return {
+            "avg": sum(ordered) / count,
+            # Nearest-rank percentiles
+            "p50": ordered[math.ceil(0.5 * count) - 1],
+            "p95": ordered[math.ceil(0.95 * count) - 1],
+            "max": ordered[-1],
+        }
+
+    def _iter_completed(
+        self, services: List[Dict[str, Any]], fail_fast: bool = False
+    ) -> Iterator[Tuple[int, ServiceResult]]:
+        """Yield (input index, result) pairs as checks complete"""
+        # Group duplicate entries (e.g. several presets on localhost:3000) so
+        # each distinct endpoint is checked once and fanned out to every index
+        http_groups: Dict[str, List[int]] = {}
+        port_groups: Dict[Tuple[str, int], List[int]] = {}
+        for index, service in enumerate(services):
             if service.get("type") == "http":
-                result = self.check_http_service(service["url"])
+                http_groups.setdefault(service["url"], []).append(index)
             elif service.get("type") == "port":
-                result = self.check_port_service(
-                    service.get("host", "localhost"), service["port"]
-                )
-            else:
-                continue
-
-            results.append(result.to_dict())
+                target = (service.get("host", "localhost"), service["port"])
+                port_groups.setdefault(target, []).append(index)
+
+        def fan_out(index_groups, results):
+            if isinstance(results, ServiceResult):
+                results = [results]
+            for indexes, result in zip(index_groups, results):
+                for index in indexes:
+                    yield index, result
+
+        futures: Dict[Future, List[List[int]]] = {}
+        port_targets = list(port_groups)
+        port_index_groups = list(port_groups.values())
+
+        # All port checks share one selector instead of a thread each. With
+        # nothing else to wait on, run it here and skip the executor handoff.
+        if port_targets and not http_groups:
+            completed = fan_out(port_index_groups, self.check_ports_batch(port_targets))
+        else:
+            for url, indexes in http_groups.items():
+                futures[self.executor.submit(self.check_http_service, url)] = [indexes]
+            if port_targets:
+                future = self.executor.submit(self.check_ports_batch, port_targets)
+                futures[future] = port_index_groups
+            completed = (
+                pair
+                for future in as_completed(futures)
+                for pair in fan_out(futures[future], future.result())
+            )
 
-        return {
+        try:
+            for index, result in completed:
+                yield index, result
+                if fail_fast and result.status not in HEALTHY_STATUSES:
+                    return
+        finally:
+            # Drop checks that have not started yet once the caller stops reading
+            for future in futures:
+                future.cancel()
+
+    def iter_multiple_services(
+        self, services: List[Dict[str, Any]], fail_fast: bool = False
+    ) -> Iterator[ServiceResult]:
+        """Yield service results in completion order"""
+        for _, result in self._iter_completed(services, fail_fast):
+            yield result
+
+    def summarize_results(
+        self, results: List[ServiceResult], include_services: bool = True
+    ) -> Dict[str, Any]:
+        """Tally online services and response times in a single pass"""
+        services = []
+        response_times = []
+        online_services = 0
+
+        for result in results:
+            if result.status in HEALTHY_STATUSES:
+                online_services += 1
+            if result.response_time is not None:
+                response_times.append(result.response_time)
+            if include_services:
+                services.append(result.to_dict())
+
+        summary = {
             "total_services": len(results),
-            "online_services": len(
-                [r for r in results if r["status"] in ["up", "open"]]
-            ),
-            "services": results,
-            "timestamp": time.time(),
+            "online_services": online_services,
+            "response_time_stats": self._response_time_stats(response_times),
         }
+        if include_services:
+            summary["services"] = services
+        summary["timestamp"] = time.time()
+        return summary
+
+    def check_multiple_services(
+        self, services: List[Dict[str, Any]], fail_fast: bool = False
+    ) -> Dict[str, Any]:
+        # Checks are I/O-bound, so run them concurrently; results come back
+        # in completion order and are re-sorted into input order below
+        completed = dict(self._iter_completed(services, fail_fast))
+        return self.summarize_results([completed[i] for i in sorted(completed)])
+
+    def run_monitor(
+        self,
+        services: List[Dict[str, Any]],
+        base_interval: float,
+        stop_event: Optional[threading.Event] = None,
+    ):
+        """Check services periodically, backing off while nothing changes"""
+        stop_event = stop_event or threading.Event()
+        interval = base_interval
+        last_statuses = None
+        next_run = time.monotonic()
+
+        while not stop_event.is_set():
+            try:
+                results = self.check_multiple_services(services)["services"]
+                statuses = tuple(r["status"] for r in results)
+            except Exception:
+                # Keep monitoring; a bad config entry shouldn't stop the thread
+                logger.exception("Error in monitoring run")
+                statuses = None
+
+            # Stretch the interval while the environment is stable and snap
+            # back to the configured cadence as soon as anything changes
+            if statuses == last_statuses:
+                interval = min(interval * MONITOR_BACKOFF_FACTOR, MAX_MONITOR_INTERVAL)
+            else:
+                interval = base_interval
+            last_statuses = statuses
+
+            # Schedule from the previous start so check time doesn't add drift
+            next_run = max(next_run + interval, time.monotonic())
+            stop_event.wait(next_run - time.monotonic())
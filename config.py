@@ -2,7 +2,14 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -55,16 +62,19 @@ class DevAssistantConfig:
                 "webhook_enabled": False
             }
         }
+        self._services_json: Dict[str, str] = {}
+        self._all_services: Optional[List[Dict[str, Any]]] = None
         self.load_config()
 
     def load_config(self):
         """Load configuration from file or create default if not exists"""
+        self._services_json.clear()
+        self._all_services = None
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-                    # Merge with defaults for any missing keys
-                    self._merge_defaults()
+                self.config = self._read_json()
+                # Merge with defaults for any missing keys
+                self._merge_defaults()
             else:
                 self.config = self.default_config.copy()
                 self.save_config()
@@ -72,6 +82,23 @@ class DevAssistantConfig:
             logger.error(f"Error loading config: {e}")
             self.config = self.default_config.copy()
 
+    def _read_json(self) -> Dict[str, Any]:
+        """Parse the config file, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.loads(Path(self.config_file).read_bytes())
+        with open(self.config_file, 'r') as f:
+            return json.load(f)
+
+    def _write_json(self, data: Dict[str, Any]):
+        """Write the config file, using orjson when it is installed"""
+        if orjson is not None:
+            Path(self.config_file).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(self.config_file, 'w') as f:
+                json.dump(data, f, indent=2)
+
     def _merge_defaults(self):
         """Merge loaded config with defaults"""
         def merge_dict(target, source):
@@ -85,9 +112,10 @@ class DevAssistantConfig:
 
     def save_config(self):
         """Save current configuration to file"""
+        self._services_json.clear()
+        self._all_services = None
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            self._write_json(self.config)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
 
@@ -96,3 +124,28 @@ class DevAssistantConfig:
         if category:
             return self.config.get("services", {}).get(category, [])
         return self.config.get("services", {})
+
+    def get_all_services(self) -> List[Dict[str, Any]]:
+        """Get every configured service as one flat list, cached until saved"""
+        if self._all_services is None:
+            self._all_services = list(
+                chain.from_iterable(
+                    services for services in self.get_services().values() if services
+                )
+            )
+        return self._all_services
+
+    def get_services_json(self, category: Optional[str] = None) -> str:
+        """Get services configuration serialized as JSON, cached until saved"""
+        key = category or ""
+        cached = self._services_json.get(key)
+        if cached is None:
+            services = self.get_services(category)
+            if orjson is not None:
+                cached = orjson.dumps(services).decode()
+            else:
+                cached = json.dumps(services)
+            # Only cache real categories so arbitrary names can't grow the cache
+            if not category or category in self.config.get("services", {}):
+                self._services_json[key] = cached
+        return cached
@@ -0,0 +1,10 @@
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app, start_monitoring  # noqa: E402
+
+start_monitoring()
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=5000)